@@ -302,6 +302,12 @@ class ConfigWrapper():
             return self.header["enable_multiprocessing"]
         return _config_header_parameters()["enable_multiprocessing"]["default"]
 
+    @property
+    def header_enable_cpu_affinity(self):
+        if "enable_cpu_affinity" in self.header:
+            return self.header["enable_cpu_affinity"]
+        return _config_header_parameters()["enable_cpu_affinity"]["default"]
+
 
 class ConfigReader():
     """Reader of Dictionary in Configuration."""
@@ -68,6 +68,13 @@ def config_header_parameters():
             "default": True
         },
 
+        "enable_cpu_affinity": {
+            "description": "Flag to pin operator processes to the available "\
+                           "CPUs in turn (Linux only). Default: False",
+            "dtype": bool,
+            "default": False
+        },
+
         "shared_data": {
             "description": "Dictionary with globally shared data such as "\
                            "flags, static parameters, or any other data.",
@@ -22,6 +22,7 @@
 """Network abstraction of any operators."""
 
 # Third-Party Dependencies
+from sys import intern as _intern
 from secrets import token_urlsafe as _token_urlsafe
 
 # Local Dependencies
@@ -33,6 +34,15 @@ from governor.io.types import get_config_values as _get_config_values
 class Network():
     """Directed graph of operators representing a network."""
 
+    # Operator identifiers and names, with run_after referring to the former
+    _NAMES = ("id_", "name", "module_path", "class_name", "run_after")
+
+    # Operator parameter dictionaries keyed by parameter names
+    _PARAMS = ("class_params", "dedicated_input_params", "shared_input_params")
+
+    __slots__ = ("_id", "_name", "_me", "_operators", "_edges",
+                 "_null_operator_id", "_operator_defaults")
+
     def __init__(self,
                  # Required inputs
                  id_: str,
@@ -70,6 +80,25 @@ class Network():
         # Build network
         self._build(config.operators)
 
+    def __getstate__(self):
+        """State for pickling.
+
+        Note: Operator defaults are already applied to the operator
+              configurations, and are recreated on unpickling rather
+              than being serialized.
+        """
+        return (self._id, self._name, self._operators, self._edges,
+                self._null_operator_id)
+
+    def __setstate__(self, state):
+        """Restore state from pickling."""
+        (self._id, self._name, self._operators, self._edges,
+         self._null_operator_id) = state
+        self._me = "Network():"
+        self._operator_defaults = _get_config_values(
+            "config_payload_operator_parameters()",
+            "default")
+
     @property
     def edges(self):
         """List of network edges."""
@@ -164,6 +193,7 @@ class Network():
                 config = cfg,
                 defaults = self._operator_defaults
             )
+            self._intern_config(self._operators[ids_[-1]])
 
         # Add null operator
         if self.null_operator_id not in self._operators:
@@ -314,6 +344,33 @@ class Network():
         #                self._edges[update_edge].source = \
         #                    self._edges[update_edge-1].target
 
+    def _intern_config(self, operator_config: _ConfigReader):
+        """Intern identifiers and parameter names of operator configuration.
+
+        Note: Operator identifiers key the dictionaries and sets of
+              the network and controller, and parameter names recur
+              across operators and are passed on as keyword arguments.
+              Interned strings compare by identity in either case.
+
+        Args:
+            operator_config: Operator configuration reader
+        """
+        for attribute in self._NAMES:
+            value = getattr(operator_config, attribute, None)
+            if isinstance(value, str):
+                setattr(operator_config, attribute, _intern(value))
+            elif isinstance(value, list):
+                setattr(operator_config, attribute,
+                        [_intern(item) if isinstance(item, str) else item
+                         for item in value])
+
+        for attribute in self._PARAMS:
+            params = getattr(operator_config, attribute, None)
+            if isinstance(params, dict):
+                setattr(operator_config, attribute,
+                        {_intern(key) if isinstance(key, str) else key: value
+                         for key, value in params.items()})
+
     def _operator_id(self, operator_config: dict) -> str:
         """Return unique identifier of operator.
 
@@ -325,7 +382,7 @@ class Network():
         """
         if "id_" in operator_config:
             if operator_config["id_"] not in self._operators:
-                return operator_config["id_"]
+                return _intern(operator_config["id_"])
             else:
                 # Sanity (bug) check: should be discovered already during
                 # config import validation
@@ -333,7 +390,7 @@ class Network():
                                  f"operator identifier found: "\
                                  f"{operator_config['id_']}")
         else:
-            return self._create_id()
+            return _intern(self._create_id())
 
     def _create_id(self, length: int = 16) -> str:
         """Create random unique id.
@@ -352,6 +409,9 @@ class Network():
 
     class _Link():
         """Named network links."""
+
+        __slots__ = ("source", "target", "label")
+
         def __init__(self,
                      source: str = None,
                      target: str = None,
@@ -22,6 +22,7 @@
 """Operator abstraction of any Python code."""
 
 # Third-Party Dependencies
+from functools import lru_cache as _lru_cache
 from importlib import import_module as _import
 from timeit import default_timer as _timer
 
@@ -30,6 +31,23 @@ from governor.objects.types import OperatorState as _OperatorState
 from governor.io.config import ConfigReader as _ConfigReader
 
 
+@_lru_cache(maxsize=None)
+def _load(module_path: str, name: str) -> any:
+    """Load function or class from module once.
+
+    Note: Operators of repeated jobs are created anew, while the
+          module members they refer to are the same.
+
+    Args:
+        module_path: Path to module
+        name: Name of module member
+
+    Returns:
+        Module member
+    """
+    return getattr(_import(module_path), name)
+
+
 class OperatorSettings():
     """Settings Helper for Operator() class initialization."""
 
@@ -143,7 +161,7 @@ class Operator():
 
                     # Loading operator directly
                     self._operator_ref = f"{module_path}.{name}"
-                    self._operator = getattr(_import(module_path), name)
+                    self._operator = _load(module_path, name)
 
                 # Operator contained in class without parameters
                 elif class_params is None:
@@ -152,9 +170,7 @@ class Operator():
                     # without parameters passed to the constructor
                     self._operator_ref = f"{module_path}.{class_name}().{name}"
                     self._operator = \
-                        getattr(
-                            getattr(
-                                _import(module_path), class_name)(), name)
+                        getattr(_load(module_path, class_name)(), name)
 
                 # Operator contained in class with parameters
                 else:
@@ -164,10 +180,8 @@ class Operator():
                     self._operator_ref = f"{module_path}.{class_name}"\
                                             "(**class_params).{name}"
                     self._operator = \
-                        getattr(
-                            getattr(
-                                _import(module_path),
-                                class_name)(**class_params), name)
+                        getattr(_load(module_path, class_name)(**class_params),
+                                name)
 
             # Use provided operator
             else:
@@ -22,11 +22,12 @@
 """Common type definitions used by operators and graphs."""
 
 # Dependencies
-from enum import Enum as _Enum, unique as _unique
+from enum import IntEnum as _IntEnum, unique as _unique
+from types import MappingProxyType as _MappingProxyType
 
 
 @_unique
-class OperatorState(_Enum):
+class OperatorState(_IntEnum):
     """Operator state types."""
     ERROR = -1
     OFFLINE = 0
@@ -34,11 +35,17 @@ class OperatorState(_Enum):
     COMPLETED = 2
 
 
+_OPERATOR_STATE_DESCRIPTION = _MappingProxyType({
+    OperatorState.ERROR: "Operator execution failed.",
+    OperatorState.OFFLINE: "Operator is not running.",
+    OperatorState.ONLINE: "Operator is running.",
+    OperatorState.COMPLETED: "Operator execution completed."
+})
+
+
 def operator_state_description():
-    """Operator state descriptions."""
-    return {
-        OperatorState.ERROR: "Operator execution failed.",
-        OperatorState.OFFLINE: "Operator is not running.",
-        OperatorState.ONLINE: "Operator is running.",
-        OperatorState.COMPLETED: "Operator execution completed."
-    }
+    """Operator state descriptions.
+
+    Note: The same read-only mapping is returned on every call.
+    """
+    return _OPERATOR_STATE_DESCRIPTION
@@ -1,7 +1,17 @@
 """Governor Runtime Module"""
 
 # Expose selection
-from .controller import Controller
-from .server import Server
-
+# Note: Imported on first access, such that operator processes loading
+#       governor.runtime.multiprocessing do not import the controller
+#       and server along with their dependencies
 __all__ = ['Controller', 'Server']
+
+
+def __getattr__(name: str):
+    if name == 'Controller':
+        from .controller import Controller
+        return Controller
+    if name == 'Server':
+        from .server import Server
+        return Server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
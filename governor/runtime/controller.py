@@ -62,8 +62,9 @@ class Controller():
         self._tree = None
         self._memory = _Memory()
         self._parallelize = False
+        self._cpu_affinity = False
         self._executed = []
-        self._completed = []
+        self._completed = set()
 
         # Load config
         self._load_configuration(config)
@@ -144,6 +145,7 @@ class Controller():
 
         # Prepare to parallelize (TODO: prep mp)
         self._parallelize = self._config.header_enable_multiprocessing
+        self._cpu_affinity = self._config.header_enable_cpu_affinity
 
     @property
     def tree(self) -> dict:
@@ -216,7 +218,7 @@ class Controller():
         """
         # Setup runtime variables
         jobs = _Jobs()
-        processors = _Processors()
+        processors = _Processors(affinity=self._cpu_affinity)
 
         # Create jobs from null operator
         for id_ in self.tree[self._network.null_operator_id]:
@@ -256,8 +258,8 @@ class Controller():
                     if run_after not in self._completed:
                         block = True
                 elif isinstance(run_after, list):
-                    if not all([id_after in self._completed\
-                            for id_after in run_after]):
+                    if not all(id_after in self._completed
+                               for id_after in run_after):
                         block = True
             
             # Ignore blocks and online jobs
@@ -290,6 +292,11 @@ class Controller():
         # Wait until first process finished, then update job and trigger next one
         while block:
 
+            # Completed operators/jobs
+            # Note: Collected before the error check, since operators set
+            #       their error state ahead of the done state
+            completed_operators = processors.done_operators()
+
             # Errors
             if processors.any_errors():
                 print("ERRORs")
@@ -298,8 +305,6 @@ class Controller():
                 raise ValueError(f"{self._me} Processor errors: "\
                                  f"{error_messages}")
 
-            # Completed operators/jobs
-            completed_operators = processors.done_operators()
             new_completed_opeartors = [id_ for id_ in completed_operators if id_ in jobs.all]
 
             # Process completed jobs
@@ -336,7 +341,7 @@ class Controller():
                                 })
 
                     # Register completion
-                    self._completed.append(id_)
+                    self._completed.add(id_)
 
                     # Delete old
                     jobs.delete(id_)
@@ -351,6 +356,14 @@ class Controller():
             # All done
             if (len(new_completed_opeartors) > 0 or processors.num_processors == 0):
                 block = False
+
+            # Sleep until any operator process exits
+            # Note: Processes exit right after setting their done state,
+            #       but may still be blocked on sending an error return
+            #       no one receives yet, hence timeout bounds the delay
+            #       until done and error states are re-checked
+            else:
+                processors.wait(timeout=0.1)
         
         # Process jobs
         if jobs.num_jobs > 0:
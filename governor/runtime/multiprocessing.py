@@ -19,19 +19,177 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""Distribution handler for multiprocessing operators in network nodes."""
+"""Distribution handler for multiprocessing operators in network nodes.
+
+Note: Operator processes are started from a fork server where available,
+      such that scripts launching a controller with multiprocessing
+      enabled require an `if __name__ == "__main__":` guard.
+"""
 
 # Third-Party Dependencies
-from multiprocessing import Process as _Process
-from multiprocessing import Queue as _Queue
-from multiprocessing import Event as _Event
-from time import sleep as _sleep
+from collections import namedtuple as _namedtuple
+from multiprocessing import get_all_start_methods as _get_all_start_methods
+from multiprocessing import get_context as _get_context
+from multiprocessing import forkserver as _forkserver
+from multiprocessing.connection import Connection as _Connection
+from multiprocessing.connection import wait as _wait
+from multiprocessing.shared_memory import SharedMemory as _SharedMemory
+from threading import Condition as _ThreadingCondition
+from threading import Thread as _Thread
 from time import time_ns as _time_ns
+from time import monotonic as _monotonic
+from time import sleep as _sleep
 from os import getpid as _getpid
+from pickle import dumps as _dumps
+from pickle import loads as _loads
+from pickle import HIGHEST_PROTOCOL as _HIGHEST_PROTOCOL
+from sys import modules as _modules
+from importlib.util import find_spec as _find_spec
+try:
+    from os import sched_getaffinity as _sched_getaffinity
+    from os import sched_setaffinity as _sched_setaffinity
+except ImportError:
+    _sched_getaffinity = None
+    _sched_setaffinity = None
 
 # Local Dependencies
 from governor.objects.operator import Operator as _Operator
 
+# Handle of a numpy array return placed in shared memory
+_SharedArray = _namedtuple("_SharedArray", "name shape dtype")
+
+# Handle of a pickled operator placed in shared memory
+# Note: Only done from the given size on, below which passing the
+#       bytes is cheaper than setting up a shared memory block
+_SharedPickle = _namedtuple("_SharedPickle", "name size")
+_SHARED_PICKLE_SIZE = 1 << 16
+
+# Multiprocessing context
+# Note: The fork server forks children from a single process with the
+#       governor modules already imported, instead of copying the caller
+#       (fork) or starting a fresh interpreter per operator (spawn).
+if "forkserver" in _get_all_start_methods():
+    _ctx = _get_context("forkserver")
+else:
+    _ctx = _get_context()
+
+# Modules to preload in the fork server
+# Note: Only what operator processes need, as this module itself is
+#       light to import. numpy is preloaded where installed, as
+#       operators commonly import it and would otherwise pay its
+#       import per process.
+_PRELOAD = [
+    "governor.io",
+    "governor.objects.operator",
+    *(["numpy"] if _find_spec("numpy") is not None else [])
+]
+_preloaded = False
+_Process = _ctx.Process
+_Pipe = _ctx.Pipe
+_Event = _ctx.Event
+_Semaphore = _ctx.Semaphore
+
+
+def _preload():
+    """Add governor modules to the preload of the fork server.
+
+    Note: The preload list is global to the interpreter and only read
+          once the fork server is launched. It is therefore extended
+          rather than replaced, and only right before the first
+          operator process is started.
+    """
+    global _preloaded  # pylint: disable=global-statement
+    if _preloaded or _ctx.get_start_method() != "forkserver":
+        return
+
+    # Current preload list
+    # Note: Not exposed publicly, hence read from the private attribute
+    #       of the fork server singleton, as found in CPython 3.8 to
+    #       3.13. If missing, any preload set by others is replaced.
+    server = getattr(_forkserver, "_forkserver", None)
+    modules = list(getattr(server, "_preload_modules", None) or [])
+    modules.extend(name for name in _PRELOAD if name not in modules)
+    _ctx.set_forkserver_preload(modules)
+    _preloaded = True
+
+
+def _share_array(response: any) -> any:
+    """Move numpy array return into shared memory.
+
+    Note: numpy is not a dependency of governor, but is necessarily
+          loaded if an operator returns an array. Arrays are copied
+          into a shared memory block once, such that only a small
+          handle is pickled onto the return queue.
+
+    Args:
+        response: Operator return value
+
+    Returns:
+        _SharedArray handle or unchanged return value
+    """
+    numpy = _modules.get("numpy")
+    if (numpy is None or type(response) is not numpy.ndarray
+            or response.dtype.hasobject or response.nbytes == 0):
+        return response
+
+    shm = _SharedMemory(create=True, size=response.nbytes)
+    try:
+        numpy.ndarray(response.shape, response.dtype,
+                      buffer=shm.buf)[...] = response
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return _SharedArray(shm.name, response.shape, response.dtype)
+
+
+def _restore_array(response: any) -> any:
+    """Copy numpy array return out of shared memory.
+
+    Note: The shared memory block is released afterwards.
+
+    Args:
+        response: Operator return value as received from return queue
+
+    Returns:
+        numpy array or unchanged return value
+    """
+    if type(response) is not _SharedArray:
+        return response
+
+    # pylint: disable=import-outside-toplevel
+    import numpy
+    # pylint: enable=import-outside-toplevel
+    shm = _SharedMemory(name=response.name)
+    try:
+        return numpy.ndarray(response.shape, response.dtype,
+                             buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _load_operator(operator: any) -> _Operator:
+    """Unpickle operator, optionally out of shared memory.
+
+    Args:
+        operator: Pickled operator or _SharedPickle handle
+
+    Returns:
+        Operator object
+    """
+    if type(operator) is not _SharedPickle:
+        return _loads(operator)
+
+    shm = _SharedMemory(name=operator.name)
+    buf = shm.buf[:operator.size]
+    try:
+        return _loads(buf)
+    finally:
+        buf.release()
+        shm.close()
+
 
 class ProcessMetaData():
     """Abstraction of meta data from a process."""
@@ -69,37 +227,141 @@ class ProcessMetaData():
     def dict(self) -> dict:
         """Returns dictionary version of meta data.
 
-        Note: Milliseconds are returned but with
-              nanosecond precision.        
+        Note: Times are returned in whole microseconds
+              since epoch.
         """
         return {
-            "start_time_ms": self._start_time_ns/1000,
-            "end_time_ms": self._end_time_ns/1000,
+            "start_time_us": self._start_time_ns // 1000,
+            "end_time_us": self._end_time_ns // 1000,
             "pid": self._pid
         }
 
 
+class _ProcessFlags():
+    """Start, done and error states of operators in shared memory.
+
+    Note: Each state is kept as one byte per operator, such that
+          reading a state is a plain memory access instead of a
+          semaphore per operator and state. A byte has exactly one
+          writer, so setting it needs no lock, and the bytes of a
+          state are contiguous to be compared in a single slice.
+          No lock is shared with the processes at all, since one
+          terminated while holding it would leave it acquired.
+    """
+
+    __slots__ = ("_size", "_flags", "_all")
+
+    START = 0
+    DONE = 1
+    ERROR = 2
+
+    # Byte value of a set flag
+    _SET = b"\x01"
+
+    def __init__(self, size: int):
+        """Initialize operator states.
+
+        Args:
+            size: Number of operators
+        """
+        self._size = size
+        self._flags = _ctx.RawArray("c", 3 * size)
+        self._all = self._SET * size
+
+    def set(self, state: int, index: int):
+        """Set state of operator.
+
+        Args:
+            state: State type, i.e. START, DONE or ERROR
+            index: Index of operator
+        """
+        self._flags[state * self._size + index] = self._SET
+
+    def is_set(self, state: int, index: int) -> bool:
+        """Flag if state of operator is set.
+
+        Args:
+            state: State type, i.e. START, DONE or ERROR
+            index: Index of operator
+
+        Returns:
+            Boolean
+        """
+        return self._flags[state * self._size + index] == self._SET
+
+    def all_set(self, state: int) -> bool:
+        """Flag if state of all operators is set.
+
+        Args:
+            state: State type, i.e. START, DONE or ERROR
+
+        Returns:
+            Boolean
+        """
+        offset = state * self._size
+        return self._flags[offset:offset + self._size] == self._all
+
+    def any_set(self, state: int) -> bool:
+        """Flag if state of any operator is set.
+
+        Args:
+            state: State type, i.e. START, DONE or ERROR
+
+        Returns:
+            Boolean
+        """
+        offset = state * self._size
+        return self._SET in self._flags[offset:offset + self._size]
+
+    def indices(self, state: int) -> list:
+        """Indices of operators with state set.
+
+        Args:
+            state: State type, i.e. START, DONE or ERROR
+
+        Returns:
+            List of operator indices
+        """
+        offset = state * self._size
+        flags = self._flags[offset:offset + self._size]
+        if self._SET not in flags:
+            return []
+        return [index for index, flag in enumerate(flags) if flag]
+
+
 class OperatorProcess(_Process):
     """Process for operators"""
 
+    # Note: The process name is a property of the base class,
+    #       which keeps its own instance dictionary
+    __slots__ = ("_operator", "_return_writer", "_expected_return",
+                 "_release", "_standby_event", "_states", "_index",
+                 "_cpu")
+
     def __init__(self,
-                 operator: _Operator,
+                 operator: bytes,
                  name: str = "",
-                 return_queue: _Queue = None,
+                 return_writer: _Connection = None,
+                 expected_return: bool = False,
+                 release: _Semaphore = None,
                  standby_event: _Event = None,
-                 start_event: _Event = None,
-                 done_event: _Event = None,
-                 error_event: _Event = None):
+                 states: _ProcessFlags = None,
+                 index: int = 0,
+                 cpu: int = None):
         """Initialize a new process.
 
         Args:
-            operator: Operator to run in this process
+            operator: Pickled operator to run in this process
             name: (Optional) Identifier of operator process
-            return_queue: (Optional) Operator return queue
+            return_writer: (Optional) Sending end of return pipe
+            expected_return: (Optional) Flag to put operator return
+                             on the return queue
+            release: (Optional) Semaphore to release pre-spawned process
             standby_event: (Optional) Event to launch in standby mode
-            start_event: (Optional) Event to notify caller of started execution
-            done_event: (Optional) Event to notify caller of completed execution
-            error_event: (Optional) Event to notify caller of error
+            states: (Optional) States to notify caller of started and
+                    completed execution, and of errors
+            index: (Optional) Index of operator in :states:
+            cpu: (Optional) CPU to pin this process to
         """
         # Base constructor
         _Process.__init__(self)
@@ -109,28 +371,46 @@ class OperatorProcess(_Process):
 
         # Private vars
         self._operator = operator
-        self._return_queue = return_queue
+        self._return_writer = return_writer
+        self._expected_return = expected_return
+        self._release = release
         self._standby_event = standby_event
-        self._start_event = start_event
-        self._done_event = done_event
-        self._error_event = error_event
-
-    @property
-    def return_value(self):
-        """Return value of operator"""
-        return self._return_queue.get() if self._return_queue is not None\
-                                        else None
+        self._states = states
+        self._index = index
+        self._cpu = cpu
 
     def run(self):
         """Operator run method"""
 
+        # CPU affinity
+        # Note: Best effort, e.g. the CPU may have gone offline
+        if self._cpu is not None:
+            try:
+                _sched_setaffinity(0, {self._cpu})
+            except OSError:
+                pass
+
+        # Operator
+        # Note: A failure to load is reported once released, such that
+        #       it surfaces like any error of the operator itself
+        operator = None
+        failure = None
+        try:
+            operator = _load_operator(self._operator)
+        except BaseException as err:
+            failure = err
+
+        # Pre-spawned
+        if self._release is not None:
+            self._release.acquire()
+
         # Standby
         if self._standby_event is not None:
             self._standby_event.wait()
 
         # Notify start
-        if self._start_event is not None:
-            self._start_event.set()
+        if self._states is not None:
+            self._states.set(_ProcessFlags.START, self._index)
 
         # Register meta data
         meta = ProcessMetaData(
@@ -139,35 +419,73 @@ class OperatorProcess(_Process):
         )
 
         # Execute
-        try:
-            if self._return_queue is None:
-                _ = self._operator.run()
-            else:
-                self._return_queue.put(
-                    (self._operator.run().response,
-                     meta.end_time_ns(_time_ns()).dict)
-                )
-        except RuntimeError:
-            self._return_queue.put(
-                (self._operator.exceptione,
-                 meta.end_time_ns(_time_ns()).dict)
-            )
-            self._error_event.set()
-            pass
+        ret = None
+        error = False
+        if failure is not None:
+            ret = (repr(failure).replace("\n", " "),
+                   meta.end_time_ns(_time_ns()).dict)
+            error = True
+        else:
+            try:
+                response = operator.run().response
+                if self._expected_return:
+                    ret = (_share_array(response),
+                           meta.end_time_ns(_time_ns()).dict)
+            except RuntimeError:
+                ret = (operator.exception,
+                       meta.end_time_ns(_time_ns()).dict)
+                error = True
+            except BaseException as err:
+                # Note: Not wrapped by the operator, e.g. SystemExit
+                ret = (repr(err).replace("\n", " "),
+                       meta.end_time_ns(_time_ns()).dict)
+                error = True
+
+        # Serialize return
+        # Note: Ahead of the done state, such that a return failing to
+        #       pickle is reported as error instead of never being sent
+        payload = None
+        if ret is not None:
+            try:
+                payload = _dumps(ret, _HIGHEST_PROTOCOL)
+            except Exception as err:
+                payload = _dumps((repr(err).replace("\n", " "), ret[1]),
+                                 _HIGHEST_PROTOCOL)
+                error = True
+        if error and self._states is not None:
+            self._states.set(_ProcessFlags.ERROR, self._index)
 
         # Done
-        if self._done_event is not None:
-            self._done_event.set()
+        # Note: Set before the return is sent, such that a caller
+        #       receiving the return finds the operator done
+        if self._states is not None:
+            self._states.set(_ProcessFlags.DONE, self._index)
+
+        # Return
+        # Note: A single message per pipe, written as one frame of
+        #       the highest pickle protocol
+        if (payload is not None and self._return_writer is not None):
+            self._return_writer.send_bytes(payload)
 
 
 class Processor():
     """Processor of parallel operator executions."""
 
+    __slots__ = ("_me", "_processor_id", "_operators", "_return_readers",
+                 "_returns", "_returns_changed", "_drainer", "_drained",
+                 "_expected_returns", "_standby_events", "_release",
+                 "_states", "_indices", "_processes", "_operator_ids",
+                 "_operator_id_set", "_affinity", "_cpu_offset",
+                 "_pickled_operators", "_shared_pickles")
+
     def __init__(self,
                  id_: str,
                  operators: dict,
                  expected_returns: dict = None,
-                 standby_events: dict = None):
+                 standby_events: dict = None,
+                 affinity: bool = False,
+                 pickled_operators: dict = None,
+                 cpu_offset: int = 0):
         """Initialize a new processor.
 
         Args:
@@ -180,62 +498,139 @@ class Processor():
             standby_events: (Optional) dictionary of events to put
                             operator processes in standby until set
                             by caller
+            affinity: (Optional) Flag to pin operator processes to
+                      the available CPUs in turn, if supported
+            pickled_operators: (Optional) dictionary of already pickled
+                               operators, where missing ones are
+                               pickled here
+            cpu_offset: (Optional) Position among the available CPUs
+                        to pin the first operator process to
         """
         # Private vars
         self._me = "Processor():"
+        self._affinity = affinity and _sched_getaffinity is not None
+        self._cpu_offset = cpu_offset
         self._processor_id = id_
         self._operators = operators
-        self._return_queues = None
+        self._returns = {}
+        self._returns_changed = _ThreadingCondition()
+        self._drainer = None
+        self._drained = False
         self._standby_events = standby_events
-        self._start_events = {id_: _Event() for id_ in self._operators}
-        self._done_events = {id_: _Event() for id_ in self._operators}
-        self._error_events = {id_: _Event() for id_ in self._operators}
-        self._processes = {id_: None for id_ in self._operators}
-
-        # Setup optional retuns with queues
-        # Note: We use for simplicity queues in isolation, to allocate
-        #       separate memory blocks per operator
+        self._release = _Semaphore(0)
+        self._states = _ProcessFlags(len(self._operators))
+        self._shared_pickles = []
+
+        # Operators by position
+        # Note: Per-operator data is kept in lists that are aligned with
+        #       the tuple of identifiers, such that a single lookup of
+        #       the index serves all of them
+        self._operator_ids = tuple(self._operators)
+        self._operator_id_set = frozenset(self._operator_ids)
+        self._indices = {id_: index
+                         for index, id_ in enumerate(self._operator_ids)}
+        self._processes = [None] * len(self._operator_ids)
+        self._return_readers = [None] * len(self._operator_ids)
+        self._expected_returns = [False] * len(self._operator_ids)
+
+        # Pickle operators once
+        # Note: Processes receive bytes, such that the operators are
+        #       not serialized again per process start
+        if pickled_operators is None:
+            pickled_operators = {}
+        self._pickled_operators = [
+            pickled_operators[id_] if id_ in pickled_operators
+            else _dumps(operator, _HIGHEST_PROTOCOL)
+            for id_, operator in self._operators.items()
+        ]
+
+        # Setup optional returns
         if expected_returns is not None:
             # Sanity check
             if len(expected_returns) == 0:
                 raise ValueError(f"{self._me} Received no expected returns.")
 
             # Fill
-            self._return_queues = {}
-            for id_ in self._operators:
+            for index, id_ in enumerate(self._operator_ids):
                 if id_ in expected_returns:
-                    if expected_returns[id_]:
-                        self._return_queues[id_] = _Queue()
-                        #self._return_queues[id_].put(None)
-                    else:
-                        self._return_queues[id_] = None
-                else:
-                    self._return_queues[id_] = None
+                    self._expected_returns[index] = bool(expected_returns[id_])
 
     @property
     def processor_id(self) -> str:
         """Identifier of processor."""
         return self._processor_id
 
-    def return_queue(self, id_: str) -> _Queue:
-        """Retrieve return queue of operator.
+    def expects_return(self, id_: str) -> bool:
+        """Flag if return of operator is expected.
 
         Args:
             id_: Operator identifier
 
         Returns:
-            Queue() object or None
+            Boolean
         """
-        if isinstance(self._return_queues, dict):
-            if id_ in self._return_queues:
-                return self._return_queues[id_]
-            else:
-                raise ValueError(f"{self._me} Operator ID {id_} "\
-                                 f"does not exist.")
-        return None
+        return self._expected_returns[self._index(id_)]
+
+    def _drain(self):
+        """Receive operator returns from return pipes.
+
+        Note: Runs in a background thread, such that returns are
+              unpickled while the caller is busy elsewhere and
+              operators are never blocked on a full pipe. Each
+              operator sends one return at most, so a pipe is
+              closed after its return or once its process exited.
+              Callers still waiting are released once all pipes
+              are closed, as no more returns can arrive.
+        """
+        readers = {reader: id_ for id_, reader
+                   in zip(self._operator_ids, self._return_readers)
+                   if reader is not None and not reader.closed}
+        try:
+            self._drain_readers(readers)
+        finally:
+            with self._returns_changed:
+                self._drained = True
+                self._returns_changed.notify_all()
+
+    def _drain_readers(self, readers: dict):
+        """Receive returns until all return pipes are closed.
+
+        Args:
+            readers: Dictionary of operator identifiers by return pipe
+        """
+        while len(readers) > 0:
+
+            # Receive all returns ready at once
+            batch = {}
+            for reader in _wait(list(readers)):
+                id_ = readers.pop(reader)
+                try:
+                    response, meta = _loads(reader.recv_bytes())
+                except (EOFError, OSError):
+                    # Note: Exited without return, e.g. terminated
+                    batch[id_] = None
+                    continue
+                finally:
+                    reader.close()
+                batch[id_] = (_restore_array(response), meta)
+
+            # Publish batch with a single lock and wakeup
+            if len(batch) > 0:
+                with self._returns_changed:
+                    self._returns.update(batch)
+                    self._returns_changed.notify_all()
+
+    def _start_drainer(self):
+        """Start receiving returns in background, unless running."""
+        if self._drainer is None:
+            self._drainer = _Thread(target=self._drain, daemon=True)
+            self._drainer.start()
 
     def return_value(self, id_: str) -> any:
-        """Retrieve return queue of operator.
+        """Retrieve return value of operator.
+
+        Note: Blocks until the return of the operator is received,
+              or its process exited without sending one.
 
         Args:
             id_: Operator identifier
@@ -243,11 +638,37 @@ class Processor():
         Returns:
             Operator return value or None
         """
-        ret = self.return_queue(id_)
-        if ret is not None:
-            return ret.get()
+        if not (self.expects_return(id_) or self.has_error(id_)):
+            return None
 
-        return None
+        self._start_drainer()
+        with self._returns_changed:
+            self._returns_changed.wait_for(
+                lambda: id_ in self._returns or self._drained)
+            return self._returns.get(id_)
+
+    def return_values(self, ids_: list) -> dict:
+        """Retrieve return values of several operators at once.
+
+        Note: Blocks until the returns of all operators are received,
+              or their processes exited without sending one, which
+              are then collected under a single lock.
+
+        Args:
+            ids_: List of operator identifiers
+
+        Returns:
+            Dictionary of operator return values or None
+        """
+        pending = [id_ for id_ in ids_
+                   if self.expects_return(id_) or self.has_error(id_)]
+        if len(pending) > 0:
+            self._start_drainer()
+        with self._returns_changed:
+            self._returns_changed.wait_for(
+                lambda: self._drained
+                or all(id_ in self._returns for id_ in pending))
+            return {id_: self._returns.get(id_) for id_ in ids_}
 
     def _standby_event(self, id_: str) -> _Event:
         """Retrieve standby event of operator.
@@ -267,20 +688,20 @@ class Processor():
                                  f"does not exist.")
         return None
 
-    def start_event(self, id_: str) -> _Event:
-        """Retrieve start event of operator.
+    def _index(self, id_: str) -> int:
+        """Retrieve state index of operator.
 
         Args:
             id_: Operator identifier
 
         Returns:
-            Event() for start of operator
+            Index of operator in states
         """
-        if id_ in self._start_events:
-            return self._start_events[id_]
-        else:
+        index = self._indices.get(id_)
+        if index is None:
             raise ValueError(f"{self._me} Operator ID {id_} "\
                              f"does not exist.")
+        return index
 
     def is_started(self, id_: str) -> bool:
         """Flag if start state of operator is set.
@@ -291,33 +712,40 @@ class Processor():
         Returns:
             Boolean
         """
-        return self.start_event(id_).is_set()
+        index = self._indices.get(id_)
+        if index is None:
+            raise ValueError(f"{self._me} Operator ID {id_} "\
+                             f"does not exist.")
+        return self._states.is_set(_ProcessFlags.START, index)
 
-    def done_event(self, id_: str) -> _Event:
-        """Retrieve done event of operator.
+    def is_done(self, id_: str) -> bool:
+        """Flag if done state of operator is set.
 
         Args:
             id_: Operator identifier
 
         Returns:
-            Event() for done of operator
+            Boolean
         """
-        if id_ in self._done_events:
-            return self._done_events[id_]
-        else:
+        index = self._indices.get(id_)
+        if index is None:
             raise ValueError(f"{self._me} Operator ID {id_} "\
                              f"does not exist.")
+        return self._states.is_set(_ProcessFlags.DONE, index)
 
-    def is_done(self, id_: str) -> bool:
-        """Flag if done state of operator is set.
+    def wait_done(self, id_: str, timeout: float = None) -> bool:
+        """Block until done state of operator is set.
 
         Args:
             id_: Operator identifier
+            timeout: (Optional) Maximum number of seconds to wait
 
         Returns:
-            Boolean
+            Boolean flag if done state is set
         """
-        return self.done_event(id_).is_set()
+        index = self._index(id_)
+        return self._wait_for(
+            lambda: self._states.is_set(_ProcessFlags.DONE, index), timeout)
 
     def all_done(self) -> bool:
         """Flag if all operators are set to done.
@@ -325,22 +753,85 @@ class Processor():
         Returns:
             Boolean
         """
-        return all([self.is_done(id_) for id_ in self._operators])
+        return self._states.all_set(_ProcessFlags.DONE)
+
+    def waitables(self) -> list:
+        """Objects signaling progress of running operators.
+
+        Note: Sentinels of exited processes are left out, since
+              they would stay ready and wake up any waiter at once.
+
+        Returns:
+            List of running process sentinels
+        """
+        return [process.sentinel for process in self._processes
+                if process is not None and process.exitcode is None]
+
+    def _wait_for(self, done: callable, timeout: float = None) -> bool:
+        """Block until condition of operators is met.
 
-    def error_event(self, id_: str) -> _Event:
-        """Retrieve error event of operator.
+        Note: Processes exit right after setting their done state,
+              hence their sentinels are awaited to recheck it.
 
         Args:
-            id_: Operator identifier
+            done: Callable flagging if condition is met
+            timeout: (Optional) Maximum number of seconds to wait
 
         Returns:
-            Event() for errors of operator
+            Boolean flag if condition is met
         """
-        if id_ in self._error_events:
-            return self._error_events[id_]
-        else:
-            raise ValueError(f"{self._me} Operator ID {id_} "\
-                             f"does not exist.")
+        deadline = None if timeout is None else _monotonic() + timeout
+        while not done():
+            waitables = self.waitables()
+            if len(waitables) == 0:
+                return done()
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - _monotonic()
+                if remaining <= 0:
+                    return False
+            _wait(waitables, remaining)
+        return True
+
+    def wait_any_done(self, timeout: float = None) -> bool:
+        """Block until any running operator process exits.
+
+        Args:
+            timeout: (Optional) Maximum number of seconds to wait
+
+        Returns:
+            Boolean flag if woken up before timeout, or False if no
+            operator process is running
+        """
+        waitables = self.waitables()
+        if len(waitables) == 0:
+            return False
+        return len(_wait(waitables, timeout)) > 0
+
+    def wait_all_done(self, timeout: float = None) -> bool:
+        """Block until all operators are set to done.
+
+        Args:
+            timeout: (Optional) Maximum number of seconds to wait
+
+        Returns:
+            Boolean flag if all operators are set to done
+        """
+        return self._wait_for(self.all_done, timeout)
+
+    def _check_exited(self):
+        """Set error and done state of processes exited without done.
+
+        Note: A process crashed or killed before setting its done state
+              would otherwise never be reported and leave callers
+              waiting. Its flags are not written by it anymore, such
+              that they are safe to set here.
+        """
+        for index, process in enumerate(self._processes):
+            if (process is not None and process.exitcode is not None
+                    and not self._states.is_set(_ProcessFlags.DONE, index)):
+                self._states.set(_ProcessFlags.ERROR, index)
+                self._states.set(_ProcessFlags.DONE, index)
 
     def has_error(self, id_: str) -> bool:
         """Flag if error state of operator is set.
@@ -351,32 +842,115 @@ class Processor():
         Returns:
             Boolean
         """
-        return self.error_event(id_).is_set()
+        index = self._indices.get(id_)
+        if index is None:
+            raise ValueError(f"{self._me} Operator ID {id_} "\
+                             f"does not exist.")
+        self._check_exited()
+        return self._states.is_set(_ProcessFlags.ERROR, index)
+
+    def any_error(self) -> bool:
+        """Flag if error state of any operator is set.
+
+        Note: Includes processes that exited without done state.
+
+        Returns:
+            Boolean
+        """
+        self._check_exited()
+        return self._states.any_set(_ProcessFlags.ERROR)
+
+    def error_operators(self) -> list:
+        """List of operators with error state.
+
+        Returns:
+            List of operator IDs
+        """
+        self._check_exited()
+        return [self._operator_ids[index]
+                for index in self._states.indices(_ProcessFlags.ERROR)]
+
+    def _share_pickle(self, index: int) -> any:
+        """Place large pickled operator into shared memory.
+
+        Note: The block is released on close().
+
+        Args:
+            index: Index of operator
+
+        Returns:
+            _SharedPickle handle or unchanged pickled operator
+        """
+        pickled = self._pickled_operators[index]
+        if len(pickled) < _SHARED_PICKLE_SIZE:
+            return pickled
+
+        shm = _SharedMemory(create=True, size=len(pickled))
+        shm.buf[:len(pickled)] = pickled
+        self._shared_pickles.append(shm)
+        return _SharedPickle(shm.name, len(pickled))
 
     def create_processes(self):
-        """Create process per operator."""
+        """Create and pre-spawn process per operator.
+
+        Note: Processes are launched right away but held back until
+              start_processes() is called, such that the spawn cost
+              is paid here and not on the start of the operators.
+              The spawn cost is only hidden by work done in between,
+              and the idle processes stay alive until either
+              start_processes() or terminate_processes() is called,
+              one of which callers are required to follow up with.
+        """
+
+        # Fork server preload
+        _preload()
+
+        # Available CPUs
+        # Note: Taken from the affinity of this process, such that
+        #       any binding it was launched with (e.g. numactl) holds
+        cpus = sorted(_sched_getaffinity(0)) if self._affinity else None
 
         # Initialize operator processes
-        for id_, operator in self._operators.items():
-            self._processes[id_] = OperatorProcess(
-                operator=operator,
+        # Note: Each operator gets its own return pipe, of which
+        #       the sending end is closed here once handed over
+        for index, id_ in enumerate(self._operator_ids):
+            reader, writer = _Pipe(duplex=False)
+            self._return_readers[index] = reader
+            process = OperatorProcess(
+                operator=self._share_pickle(index),
                 name=id_,
-                return_queue=self.return_queue(id_),
+                return_writer=writer,
+                expected_return=self._expected_returns[index],
+                release=self._release,
                 standby_event=self._standby_event(id_),
-                start_event=self.start_event(id_),
-                done_event=self.done_event(id_),
-                error_event=self.error_event(id_)
+                states=self._states,
+                index=index,
+                cpu=(cpus[(self._cpu_offset + index) % len(cpus)]
+                     if cpus else None)
             )
+            process.start()
+            writer.close()
+            self._processes[index] = process
+
+        # Receive returns in background
+        # Note: Without expected returns, only errors are sent, which
+        #       are received once asked for by return_value()
+        if any(self._expected_returns):
+            self._start_drainer()
 
     def start_processes(self):
-        """Start all operator processes."""
-        for id_, process in self._processes.items():
-            if process is not None:
-                self._processes[id_].start()
-            else:
+        """Release all pre-spawned operator processes."""
+        for id_, process in zip(self._operator_ids, self._processes):
+            if process is None:
                 raise RuntimeError(f"{self._me} Operator ID {id_} "\
                                    f"does not have a process yet.")
 
+        # Single handoff to all operators
+        # Note: A semaphore is released once per process, which unlike
+        #       setting an event does not wait for each waiter to wake
+        for _ in self._processes:
+            self._release.release()
+
     def get_process(self, id_: str) -> OperatorProcess:
         """Retrieve operator process by identifier.
 
@@ -386,34 +960,27 @@ class Processor():
         Returns:
             OperatorProcess
         """
-        if id_ in self._processes:
-            return self._processes[id_]
-        else:
-            raise ValueError(f"{self._me} Operator ID {id_} "\
-                             f"does not exist.")
+        return self._processes[self._index(id_)]
 
-    def terminate_process(self, id_: str):
+    def terminate_process(self, id_: str, join: bool = True):
         """Terminate operator process by identifier.
 
         Args:
             id_: Operator identifier
+            join: (Optional) Flag to wait for the process to exit
         """
         try:
             # Done
-            self.done_event(id_).set()
+            index = self._index(id_)
+            self._states.set(_ProcessFlags.DONE, index)
 
             # Terminate
-            self.get_process(id_).terminate()
-            _sleep(0.5)
+            process = self._processes[index]
+            process.terminate()
 
             # Join
-            if not self.get_process(id_).is_alive():
-                self.get_process(id_).join(timeout=1.0)
-            
-            # Close respective queue
-            queue = self.return_queue(id_)
-            if queue is not None:
-                queue.close()
+            if join:
+                process.join(timeout=1.0)
 
         # pylint: disable=broad-except
         except Exception:
@@ -422,33 +989,99 @@ class Processor():
         # pylint: enable=broad-except
 
     def terminate_processes(self):
-        """Terminate all operator processes."""
-        for id_ in self._operators:
-            self.terminate_process(id_)
+        """Terminate all operator processes.
+
+        Note: All processes are signaled first and their sentinels
+              awaited together afterwards, such that they shut down
+              concurrently within a single timeout.
+        """
+        for id_ in self._operator_ids:
+            self.terminate_process(id_, join=False)
+
+        # Join exited processes
+        pending = {process.sentinel: process for process in self._processes
+                   if process is not None}
+        deadline = _monotonic() + 1.0
+        while len(pending) > 0:
+            timeout = deadline - _monotonic()
+            if timeout <= 0:
+                break
+            for sentinel in _wait(list(pending), timeout):
+                pending.pop(sentinel).join()
+        self.close()
+
+    def close(self):
+        """Release return pipes and shared memory of the processor.
+
+        Note: To be called once all operator processes have exited,
+              after which no returns can be received anymore.
+        """
+        if self._drainer is not None:
+            self._drainer.join(timeout=1.0)
+        else:
+            for reader in self._return_readers:
+                if reader is not None:
+                    reader.close()
+        for shm in self._shared_pickles:
+            shm.close()
+            shm.unlink()
+        self._shared_pickles = []
 
     @property
     def num_processes(self) -> int:
         """Number of processes."""
-        return len(self._processes)
+        return len(self._operator_ids)
+
+    @property
+    def operator_ids(self) -> tuple:
+        """Tuple of operator identifiers."""
+        return self._operator_ids
 
     @property
-    def operator_ids(self) -> list:
-        """List of operator identifiers."""
-        return list(self._operators.keys())
+    def operator_id_set(self) -> frozenset:
+        """Set of operator identifiers."""
+        return self._operator_id_set
 
 class Processors():
     """Container class for processors."""
 
-    def __init__(self):
-        """Initialize a processors container."""
+    __slots__ = ("_me", "_processors", "_operators", "_expected_returns",
+                 "_standby_events", "_operator_map", "_affinity", "_pickled",
+                 "_next_processor_id", "_next_cpu")
+
+    def __init__(self, affinity: bool = False):
+        """Initialize a processors container.
+
+        Args:
+            affinity: (Optional) Flag to pin operator processes to
+                      the available CPUs in turn, if supported
+        """
 
         # Private vars
         self._me = "Processors():"
+        self._affinity = affinity
         self._processors = {}
         self._operators = {}
         self._expected_returns = None
         self._standby_events = None
-        self._operator_map = {}
+        self._operator_map = {}  # Operator ID -> Processor
+        self._pickled = {}  # id(Operator) -> (Operator, bytes)
+        self._next_processor_id = 1
+        self._next_cpu = 0
+
+    @staticmethod
+    def event() -> _Event:
+        """Create event to be passed as standby event to add_config().
+
+        Note: Operator processes are started from the multiprocessing
+              context of this module, with which events of another
+              context, e.g. multiprocessing.Event() on Linux, cannot
+              be shared.
+
+        Returns:
+            Event object
+        """
+        return _Event()
 
     def reset(self):
         """Cleanup previous configuration"""
@@ -470,7 +1103,7 @@ class Processors():
             expected_return: (Optional) Flag to expect return
                              value
             standby_event: (Optional) Event to trigger process
-                           standby
+                           standby, as created by Processors.event()
             overwrite: (Optional) Flag to overwrite processor
                        in case the ID already exists.
                        Default: False
@@ -506,10 +1139,8 @@ class Processors():
             return None
 
         # New processor ID
-        processor_id = "1"\
-                       if self.num_processors == 0\
-                       else str(max([int(id_)\
-                            for id_ in self._processors.keys()])+1)
+        processor_id = str(self._next_processor_id)
+        self._next_processor_id += 1
 
         # Create processor
         try:
@@ -517,18 +1148,47 @@ class Processors():
                 id_ = processor_id,
                 operators = self._operators,
                 expected_returns = self._expected_returns,
-                standby_events = self._standby_events
+                standby_events = self._standby_events,
+                affinity = self._affinity,
+                pickled_operators = {id_: self._pickle(operator)
+                    for id_, operator in self._operators.items()},
+                cpu_offset = self._next_cpu
             )
         except Exception as err:
             raise ValueError(f"{self._me} Processor "\
                              f"failed initialization.") from err
 
+        # CPUs in turn across processors
+        # Note: Processors of consecutive waves run concurrently, hence
+        #       each continues where the previous one left off
+        self._next_cpu += len(self._operators)
+
         # Add respective operators to map
+        processor = self._processors[processor_id]
         for id_ in self._operators:
-            self._operator_map[id_] = processor_id
+            self._operator_map[id_] = processor
         
         return processor_id
 
+    def _pickle(self, operator: _Operator) -> bytes:
+        """Pickle operator once across processors.
+
+        Note: Repeated jobs hand the same operator object to new
+              processors. The operator is kept along with its bytes,
+              such that its id() cannot be reused by another object.
+
+        Args:
+            operator: Operator object
+
+        Returns:
+            Pickled operator
+        """
+        cached = self._pickled.get(id(operator))
+        if cached is None:
+            cached = (operator, _dumps(operator, _HIGHEST_PROTOCOL))
+            self._pickled[id(operator)] = cached
+        return cached[1]
+
     def get(self,
             id_: str,
             by_operator: bool = False) -> Processor:
@@ -543,12 +1203,8 @@ class Processors():
             Processor object or None
         """
         if by_operator:
-            if id_ in self._operator_map:
-                return self._processors[self._operator_map[id_]]
-        elif id_ in self._processors:
-            return self._processors[id_]
-        
-        return None
+            return self._operator_map.get(id_)
+        return self._processors.get(id_)
 
     @property
     def all(self) -> dict:
@@ -560,18 +1216,70 @@ class Processors():
         """Number of processors."""
         return len(self.all)
 
+    def wait(self, timeout: float = None) -> bool:
+        """Block until any operator process of any processor exits.
+
+        Note: Done states are set before a process exits, such that
+              callers re-check them after waking up. Without any
+              running process, the timeout is slept instead, such
+              that callers polling in a loop do not spin.
+
+        Args:
+            timeout: (Optional) Maximum number of seconds to wait
+
+        Returns:
+            Boolean flag if woken up before timeout
+        """
+        objects = []
+        for processor in self._processors.values():
+            objects.extend(processor.waitables())
+        if len(objects) == 0:
+            if timeout is not None:
+                _sleep(timeout)
+            return False
+        return len(_wait(objects, timeout)) > 0
+
+    def wait_all_done(self, timeout: float = None) -> bool:
+        """Block until all operators of all processors are set to done.
+
+        Args:
+            timeout: (Optional) Maximum number of seconds to wait
+
+        Returns:
+            Boolean flag if all operators are set to done
+        """
+        deadline = None if timeout is None else _monotonic() + timeout
+        for processor in self._processors.values():
+            remaining = None
+            if deadline is not None:
+                remaining = max(0., deadline - _monotonic())
+            if not processor.wait_all_done(remaining):
+                return False
+        return True
+
     def any_errors(self) -> bool:
-        """Flag if any errors in processes found."""
-        return len(self.error_messages()) > 0
+        """Flag if any errors in processes found.
+
+        Note: Only reads error states, i.e. no returns are awaited.
+        """
+        return any(processor.any_error()
+                   for processor in self._processors.values())
 
     def error_messages(self) -> str:
         """Complilation of any error messages."""
-        msg = ""
-        for operator_id, processor_id in self._operator_map.items():
-            if self._processors[processor_id].has_error(operator_id):
-                msg += " [Processor "+processor_id+", Operator "+operator_id+"]: "+\
-                       str(self._processors[processor_id].return_value(operator_id))
-        return msg
+        parts = []
+        for processor_id, processor in self._processors.items():
+            if not processor.any_error():
+                continue
+            returns = processor.return_values(processor.error_operators())
+            for operator_id, return_ in returns.items():
+                # Note: Exited without return, e.g. crashed or killed
+                if return_ is None:
+                    exitcode = processor.get_process(operator_id).exitcode
+                    return_ = f"Process exited with code {exitcode}"
+                parts.append(f" [Processor {processor_id}, "
+                             f"Operator {operator_id}]: {return_}")
+        return "".join(parts)
 
     def terminate(self,
                   id_: str = None,
@@ -591,6 +1299,7 @@ class Processors():
                 processor.terminate_processes()
             self._processors = {}
             self._operator_map = {}
+            self._pickled = {}
             self.reset()
 
         else:
@@ -599,6 +1308,7 @@ class Processors():
                 if by_operator:
                     processor.terminate_process(id_)
                     if processor.all_done():
+                        processor.close()
                         del self._processors[processor.processor_id]
                     if id_ in self._operator_map:
                         del self._operator_map[id_]
@@ -622,11 +1332,9 @@ class Processors():
             return list(self._operator_map.keys())
 
         # Mapped to processor ID
-        ids_ = []
-        for operator_id, processor_id_ in self._operator_map.items():
-            if processor_id == processor_id_:
-                ids_.append(operator_id)
-        return ids_
+        return [operator_id
+                for operator_id, processor in self._operator_map.items()
+                if processor.processor_id == processor_id]
 
     def done_operators(self) -> list:
         """List of operators with done state.
@@ -634,11 +1342,9 @@ class Processors():
         Returns:
             List of operator IDs
         """
-        done = []
-        for operator_id, processor_id in self._operator_map.items():
-            if self.get(processor_id).is_done(operator_id):
-                done.append(operator_id)
-        return done
+        return [operator_id
+                for operator_id, processor in self._operator_map.items()
+                if processor.is_done(operator_id)]
 
     def done_processors(self) -> list:
         """List of processors with only operators in done state.
@@ -666,8 +1372,6 @@ class Processors():
             return []
 
         # Search
-        matched = []
-        for proc_id, processor in self._processors.items():
-            if all([id_ in operator_ids for id_ in processor.operator_ids]):
-                matched.append(proc_id)
-        return matched
+        wanted = frozenset(operator_ids)
+        return [proc_id for proc_id, processor in self._processors.items()
+                if processor.operator_id_set <= wanted]
@@ -67,8 +67,9 @@ class Server():
             Starlette instance
         """
         # Routes
-        routes = _UI_ROUTES
-        routes.extend(_API_ROUTES)
+        # Note: Copied rather than extending the module list in place,
+        #       and API routes first as they are matched most often
+        routes = [*_API_ROUTES, *_UI_ROUTES]
 
         # Create instance
         app = _Starlette(routes=routes)
@@ -76,8 +77,16 @@ class Server():
         return app
 
     def run(self):
-        """Run the server."""
+        """Run the server.
+
+        Note: The event loop and HTTP parser are taken from uvloop and
+              httptools where installed (extra "speedups"), otherwise
+              from asyncio and h11.
+        """
         _uvicorn.run(
             self._app,
             host = self._host,
-            port = self._port)
+            port = self._port,
+            loop = "auto",
+            http = "auto",
+            lifespan = "off")
@@ -22,16 +22,167 @@
 """User Interface for web browser communication."""
 
 # Third-Party Dependencies
+from os import walk as _walk
+from os import stat as _stat
+from os.path import join as _join
+from os.path import relpath as _relpath
+from os.path import normpath as _normpath
+from gzip import compress as _compress
+from hashlib import blake2b as _blake2b
+from mimetypes import guess_type as _guess_type
+from email.utils import formatdate as _formatdate
+from anyio.to_thread import run_sync as _run_sync
 from starlette.routing import Mount as _Mount
 from starlette.staticfiles import StaticFiles as _StaticFiles
+from starlette.responses import Response as _Response
 from starlette.responses import RedirectResponse as _RedirectResponse
 from starlette.routing import Route as _Route
 
 
+def _accepts_gzip(accept_encoding: bytes) -> bool:
+    """Flag if gzip is an acceptable content coding of a request.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header
+
+    Returns:
+        Boolean
+    """
+    wildcard = False
+    for coding in accept_encoding.split(b","):
+        name, _, params = coding.partition(b";")
+        name = name.strip().lower()
+        if name not in (b"gzip", b"*"):
+            continue
+
+        # Quality value
+        # Note: A malformed value is read as not acceptable
+        quality = 1.
+        for param in params.split(b";"):
+            key, _, value = param.partition(b"=")
+            if key.strip().lower() == b"q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.
+        if name == b"gzip":
+            return quality > 0
+        wildcard = quality > 0
+    return wildcard
+
+
+class CachedStaticFiles(_StaticFiles):
+    """Static files served from memory.
+
+    Note: The packaged UI is a fixed set of files, hence each file
+          is read once on the first request together with its gzip
+          payload and ETag. Requests not matching a cached file are
+          handed to StaticFiles (redirects, 404 pages).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = None
+
+    def _load_all(self):
+        """Read files of all served directories into the cache.
+
+        Note: Only published once complete, such that concurrent
+              requests never see a partial cache.
+        """
+        cache = {}
+        for directory in self.all_directories:
+            self._load(directory, cache)
+        self._cache = cache
+
+    @staticmethod
+    def _load(directory, cache: dict):
+        """Read files of a directory tree into a cache.
+
+        Args:
+            directory: Root directory of the files
+            cache: Cache of files by path
+        """
+        for root, _, files in _walk(directory):
+            for file in files:
+                full_path = _join(root, file)
+                key = _normpath(_relpath(full_path, directory))
+
+                # First directory takes precedence, as on lookup
+                if key in cache:
+                    continue
+                with open(full_path, "rb") as f:
+                    raw = f.read()
+
+                # Precompute payloads
+                # Note: gzip payload only kept if smaller
+                gz = _compress(raw, 9)
+                media_type = _guess_type(file)[0] or "text/plain"
+                headers = {
+                    "etag": f'"{_blake2b(raw, digest_size=16).hexdigest()}"',
+                    "last-modified": _formatdate(
+                        _stat(full_path).st_mtime, usegmt=True),
+                    "vary": "Accept-Encoding",
+                }
+                cache[key] = (raw, gz if len(gz) < len(raw) else None,
+                                    media_type, headers)
+
+    def _cached(self, path: str, scope) -> tuple:
+        """Look up the cache entry of a request path.
+
+        Args:
+            path: Normalized path within the served directories
+            scope: ASGI scope of the request
+
+        Returns:
+            Cache entry or None
+        """
+        entry = self._cache.get(path)
+        if entry is None and self.html and scope["path"].endswith("/"):
+            entry = self._cache.get(_normpath(_join(path, "index.html")))
+        return entry
+
+    async def get_response(self, path: str, scope) -> _Response:
+        # Note: Files are read off the event loop, as by StaticFiles
+        if self._cache is None:
+            await _run_sync(self._load_all)
+        entry = (self._cached(path, scope)
+                 if scope["method"] in ("GET", "HEAD") else None)
+        if entry is None:
+            return await super().get_response(path, scope)
+        raw, gz, media_type, headers = entry
+
+        # Request headers
+        if_none_match = accept_encoding = b""
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value
+            elif name == b"accept-encoding":
+                accept_encoding = value
+
+        # Not modified
+        if headers["etag"].encode() in if_none_match:
+            return _Response(status_code=304, headers=headers)
+
+        # Compressed or raw content
+        body = raw
+        if gz is not None and _accepts_gzip(accept_encoding):
+            body = gz
+            headers = {**headers, "content-encoding": "gzip"}
+
+        # Headers only
+        # Note: Length of the content that a GET would have received
+        if scope["method"] == "HEAD":
+            return _Response(media_type=media_type,
+                             headers={**headers,
+                                      "content-length": str(len(body))})
+        return _Response(body, media_type=media_type, headers=headers)
+
+
 async def ui_root(request):
     return _RedirectResponse(url="/ui")
 
 UI_ROUTES = [
     _Route("/", endpoint = ui_root, methods = ["GET"]),
-    _Mount("/ui", app=_StaticFiles(packages=[("governor", "ui")], html = True), name = "ui"),
+    _Mount("/ui", app=CachedStaticFiles(packages=[("governor", "ui")], html = True), name = "ui"),
 ]
@@ -22,9 +22,27 @@
 """Collection of useful helper methods."""
 
 # Third-Party Dependencies
+from functools import lru_cache as _lru_cache
+from re import compile as _compile
+from re import escape as _escape
+from re import IGNORECASE as _IGNORECASE
+from re import Pattern as _Pattern
 from typing import Union as _Union
 
 
+@_lru_cache(maxsize=128)
+def _delimiter_pattern(delimiter: str) -> _Pattern:
+    """Compile case-insensitive pattern of delimiter once.
+
+    Args:
+        delimiter: A sub-string to split strings
+
+    Returns:
+        Compiled regular expression
+    """
+    return _compile(_escape(delimiter), _IGNORECASE)
+
+
 def string_splitter(string_object: str,
                     delimiter: str,
                     return_index: int = -1) -> _Union[list, str]:
@@ -32,6 +50,7 @@ def string_splitter(string_object: str,
 
     Note:
         If delimiter or return_index is not valid, None is returned.
+        The delimiter is matched regardless of its case.
 
     Args:
         string_object: A string
@@ -41,17 +60,16 @@ def string_splitter(string_object: str,
     Returns:
         List of splitted sub-strings or single sub-string or None
     """
-    # Vars
-    string_object_splitted = None
+    # Sanity check
+    if len(delimiter) == 0:
+        return None
 
     # Split
-    if delimiter.lower() in string_object:
-        string_object_splitted = string_object.split(delimiter.lower())
-    elif delimiter.upper() in string_object:
-        string_object_splitted = string_object.split(delimiter.upper())
+    # Note: A single scan, where no match leaves the string unsplit
+    string_object_splitted = _delimiter_pattern(delimiter).split(string_object)
 
     # Return
-    if string_object_splitted is not None:
+    if len(string_object_splitted) > 1:
         if (return_index >=0 and len(string_object_splitted) >=return_index+1):
             return string_object_splitted[return_index].strip()
         else:
@@ -69,14 +87,11 @@ def strings_contain_whitespace(*strings) -> tuple:
     Returns:
         Tuple with boolean if whitespace found and stripped string list
     """
-    # Vars
-    strings_ = []
-    has_whitespace = False
-
     # Check
-    for s in strings:
-        if " " in s:
-            has_whitespace = True
-        strings_.append(str(s).strip())
+    # Note: Stops at the first string with whitespace
+    has_whitespace = any(" " in s for s in strings)
+
+    # Strip
+    strings_ = [s.strip() for s in strings]
 
     return strings_, has_whitespace
@@ -1,7 +1,5 @@
 """Collection of test methods/operators for in-class access."""
 
-import inspect as _inspect
-
 
 class ClassNoParams():
     """Class with no parameters."""
@@ -12,22 +10,28 @@ class ClassNoParams():
 
     def operator_no_params_no_shared_no_return(self):
         """Operator with no parameters, no shared and no return"""
-        print(_inspect.currentframe().f_code.co_name)
+        print("operator_no_params_no_shared_no_return")
 
     def operator_no_shared_no_return(self, value_str: str, value_int: int):
         """Operator with parameters, no shared and no return"""
-        print(_inspect.currentframe().f_code.co_name,\
+        print("operator_no_shared_no_return",\
               ": str=", value_str,\
               "int=", value_int)
 
     def operator_no_return(self,
                            value_str: str,
                            governor_shared: dict,
-                           me_: str = _inspect.currentframe().f_code.co_name):
+                           shared_key: str = None,
+                           me_: str = None):
         """Operator with parameters, shared and no return"""
-
-        # Modify
-        if len(governor_shared) > 0:
+        if me_ is None:
+            me_ = "operator_no_return"
+
+        # Modify given key, otherwise first one
+        if shared_key is not None:
+            if shared_key in governor_shared:
+                governor_shared[shared_key] = value_str
+        elif governor_shared:
             governor_shared[next(iter(governor_shared))] = value_str
 
         print(me_,\
@@ -35,12 +39,14 @@ class ClassNoParams():
               "shared=", governor_shared)
 
     def operator(self,value_str: str,
-                governor_shared: dict):
+                governor_shared: dict,
+                shared_key: str = None):
         """Operator with parameters, shared and return"""
 
         self.operator_no_return(value_str,
                                 governor_shared,
-                                me_=_inspect.currentframe().f_code.co_name)
+                                shared_key=shared_key,
+                                me_="operator")
         return True
 
 
@@ -49,13 +55,7 @@ class ClassWithParams(ClassNoParams):
 
     def __init__(self, init_str: str, init_int: int):
         """Class with no parameters"""
-        super(ClassNoParams, self).__init__()
+        super().__init__()
         print("Init test class with params:",
               "str=", init_str,
               "int=", init_int)
-
-    def __getattr__(self, name):
-        if hasattr(ClassNoParams, name):
-            return getattr(ClassNoParams, name)
-        else:
-            return self.__getattribute__(name)
@@ -1,15 +1,13 @@
 """Collection of test methods/operators for native/direct access."""
 
-import inspect as _inspect
-
 def operator_no_params_no_shared_no_return():
     """Operator with no parameters, no shared and no return"""
-    print(_inspect.currentframe().f_code.co_name)
+    print("operator_no_params_no_shared_no_return")
 
 
 def operator_no_shared_no_return(value_str: str, value_int: int):
     """Operator with parameters, no shared and no return"""
-    print(_inspect.currentframe().f_code.co_name,\
+    print("operator_no_shared_no_return",\
           ": str=", value_str,\
           "int=", value_int)
 
@@ -19,7 +17,7 @@ def operator_no_return(value_str: str,
                        me_: str = None):
     """Operator with parameters, shared and no return"""
     if me_ is None:
-        me_ = _inspect.currentframe().f_code.co_name
+        me_ = "operator_no_return"
     print(me_,\
           ": str=", value_str,\
           "shared_param_1=", shared_param_1)
@@ -31,7 +29,7 @@ def operator(value_str: str,
 
     operator_no_return(value_str,
                        shared_param_2,
-                       me_=_inspect.currentframe().f_code.co_name)
+                       me_="operator")
     return True
 
 
@@ -39,7 +37,7 @@ def operator_multi_share(value_str: str,
                          shared_param_1: str,
                          shared_param_2: str):
     """Operator with parameters, multi-shared and no return"""
-    print(_inspect.currentframe().f_code.co_name,\
+    print("operator_multi_share",\
           ": str=", value_str,\
           "shared_param_1=", shared_param_1,\
           "shared_param_2=", shared_param_2)
@@ -48,7 +46,7 @@ def operator_multi_share(value_str: str,
 def operator_add_to_shared(value_to_add: int,
                            shared_param_3: int):
     """Operator with parameters with returned addition to shared parameter."""
-    print(_inspect.currentframe().f_code.co_name,\
+    print("operator_add_to_shared",\
           ": value_to_add=", value_to_add,\
           "shared_param_3=", shared_param_3)
     return shared_param_3 + value_to_add
@@ -1,66 +1,70 @@
 """Collection of multiproc test methods/operators for native/direct access."""
 
-import inspect as _inspect
-from time import sleep
-from datetime import datetime
+from time import sleep, strftime
 from math import sqrt
+from functools import lru_cache
+from operator import add, sub, mul, truediv
+from operator import pow as power
+
+# Arithmetics of function() by name
+_FUNCTIONS = {
+    "plus": add,
+    "minus": sub,
+    "multiply": mul,
+    "divide": truediv,
+    "power": power,
+    "sqrt_plus": lambda a, b: sqrt(a+b),
+    "sqrt_minus": lambda a, b: sqrt(a-b),
+}
 
 
 def job_noreturn(id_: str, iterations: int, process_time_sec: int):
     """Task with no shared and no return"""
-    print(datetime.now().strftime("%H:%M:%S")+
-          " START "+
-          id_+ ": "+
-          _inspect.currentframe().f_code.co_name+
-          " N="+str(iterations)+
-          " T="+str(process_time_sec)+"s",
-          flush=True
-         )
-    for _ in range(iterations):
-        sleep(process_time_sec)
-    print(datetime.now().strftime("%H:%M:%S")+
-          " END "+
-          id_,
+    print(f"{strftime('%H:%M:%S')} START {id_}: job_noreturn "
+          f"N={iterations} T={process_time_sec}s",
           flush=True)
+    sleep(iterations * process_time_sec)
+    print(f"{strftime('%H:%M:%S')} END {id_}", flush=True)
 
 def job_return(id_: str, process_time_sec: int, msg: str):
     """Task with no shared and return"""
-    print(datetime.now().strftime("%H:%M:%S")+
-          " START "+
-          id_+ ": "+
-          _inspect.currentframe().f_code.co_name+
-          " T="+str(process_time_sec)+"s",
-          flush=True
-         )
-    sleep(process_time_sec)
-    print(datetime.now().strftime("%H:%M:%S")+
-          " END "+
-          id_,
+    print(f"{strftime('%H:%M:%S')} START {id_}: job_return "
+          f"T={process_time_sec}s",
           flush=True)
+    sleep(process_time_sec)
+    print(f"{strftime('%H:%M:%S')} END {id_}", flush=True)
     return msg
 
 def function(id_: str, fcn: str, a: float, b: float):
       """Addition task with return"""
-      print(datetime.now().strftime("%H:%M:%S")+
-          " RUN "+
-          id_+ ": "+
-          _inspect.currentframe().f_code.co_name+
-          "." + fcn,
-          flush=True
-         )
-      if fcn == "plus":
-            return a+b
-      elif fcn == "minus":
-            return a-b
-      elif fcn == "multiply":
-            return a*b
-      elif fcn == "divide":
-            return a/b
-      elif fcn == "power":
-            return a**b
-      elif fcn == "sqrt_plus":
-            return sqrt(a+b)
-      elif fcn == "sqrt_minus":
-            return sqrt(a-b)
-      else:
+      print(f"{strftime('%H:%M:%S')} RUN {id_}: function.{fcn}",
+            flush=True)
+      operation = _FUNCTIONS.get(fcn)
+      if operation is None:
+            raise ValueError("Unknown function call: "+fcn)
+      return operation(a, b)
+
+
+@lru_cache(maxsize=None)
+def _numpy_functions():
+      """Arithmetics of function_batch() by name"""
+      import numpy
+      return {
+            "plus": numpy.add,
+            "minus": numpy.subtract,
+            "multiply": numpy.multiply,
+            "divide": numpy.true_divide,
+            "power": numpy.power,
+            "sqrt_plus": lambda a, b: numpy.sqrt(numpy.add(a, b)),
+            "sqrt_minus": lambda a, b: numpy.sqrt(numpy.subtract(a, b)),
+      }
+
+
+def function_batch(id_: str, fcn: str, a, b):
+      """Arithmetic task over arrays with return"""
+      print(f"{strftime('%H:%M:%S')} RUN {id_}: function_batch.{fcn}",
+            flush=True)
+      operation = _numpy_functions().get(fcn)
+      if operation is None:
             raise ValueError("Unknown function call: "+fcn)
+      return operation(a, b)
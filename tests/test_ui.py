@@ -0,0 +1,109 @@
+from asyncio import run as _run
+from gzip import decompress as _decompress
+
+import pytest
+from starlette.exceptions import HTTPException
+
+from governor.runtime.ui import CachedStaticFiles
+from governor.runtime.ui import _accepts_gzip
+
+
+CONTENT = b"console.log('governor');\n" * 100
+
+
+def request(app, method="GET", path="/app.js", headers=()):
+    """Send request to ASGI app and collect its response."""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(name.encode(), value.encode())
+                    for name, value in headers],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    _run(app(scope, receive, send))
+    start = messages[0]
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return (start["status"],
+            {name.decode(): value.decode() for name, value in start["headers"]},
+            body)
+
+
+def static_files(tmp_path):
+    (tmp_path / "app.js").write_bytes(CONTENT)
+    return CachedStaticFiles(directory=str(tmp_path), html=True)
+
+
+def test_cache_is_lazy(tmp_path):
+    app = static_files(tmp_path)
+    assert app._cache is None
+    request(app)
+    assert "app.js" in app._cache
+
+
+def test_get_raw(tmp_path):
+    status, headers, body = request(static_files(tmp_path))
+    assert status == 200
+    assert body == CONTENT
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+
+
+def test_get_gzip(tmp_path):
+    status, headers, body = request(static_files(tmp_path),
+                                    headers=[("accept-encoding", "br, gzip")])
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert _decompress(body) == CONTENT
+
+
+def test_get_gzip_refused(tmp_path):
+    status, headers, body = request(static_files(tmp_path),
+                                    headers=[("accept-encoding", "gzip;q=0")])
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert body == CONTENT
+
+
+def test_head(tmp_path):
+    status, headers, body = request(static_files(tmp_path), method="HEAD",
+                                    headers=[("accept-encoding", "gzip")])
+    assert status == 200
+    assert body == b""
+    assert headers["content-encoding"] == "gzip"
+    assert int(headers["content-length"]) < len(CONTENT)
+
+
+def test_not_modified(tmp_path):
+    app = static_files(tmp_path)
+    _, headers, _ = request(app)
+    status, _, body = request(app, headers=[("if-none-match", headers["etag"])])
+    assert status == 304
+    assert body == b""
+
+
+def test_not_found(tmp_path):
+    # Note: Handed to StaticFiles, of which the app renders the 404
+    with pytest.raises(HTTPException) as err:
+        request(static_files(tmp_path), path="/missing.js")
+    assert err.value.status_code == 404
+
+
+def test_accepts_gzip():
+    assert _accepts_gzip(b"gzip")
+    assert _accepts_gzip(b"deflate, GZIP;q=0.5")
+    assert _accepts_gzip(b"*")
+    assert not _accepts_gzip(b"")
+    assert not _accepts_gzip(b"br")
+    assert not _accepts_gzip(b"gzip;q=0")
+    assert not _accepts_gzip(b"gzip;q=0.0, *")
+    assert not _accepts_gzip(b"*;q=0")